@@ -30,6 +30,9 @@ class AccountManager:
     _default_account_name_legacy = "default-legacy"
     _default_account_name_ibm_quantum = "default-ibm-quantum"
     _default_channel_type = "ibm_quantum"
+    _default_account_names = frozenset(
+        {_default_account_name, _default_account_name_ibm_quantum}
+    )
 
     @classmethod
     def save(
@@ -77,39 +80,27 @@ class AccountManager:
             return channel is None or account.channel == channel
 
         def _matching_default(account_name: str) -> bool:
-            default_accounts = [
-                cls._default_account_name,
-                cls._default_account_name_ibm_quantum,
-            ]
             if default is None:
                 return True
             elif default is False:
-                return account_name not in default_accounts
+                return account_name not in cls._default_account_names
             else:
-                return account_name in default_accounts
-
-        # load all accounts
-        all_accounts = map(
-            lambda kv: (
-                kv[0],
-                Account.from_saved_format(kv[1]),
-            ),
-            read_config(filename=cls._default_account_config_json_file).items(),
-        )
-
-        # filter based on input parameters
-        filtered_accounts = dict(
-            list(
-                filter(
-                    lambda kv: _matching_channel(kv[1])
-                    and _matching_default(kv[0])
-                    and _matching_name(kv[0]),
-                    all_accounts,
-                )
-            )
+                return account_name in cls._default_account_names
+
+        # load all accounts and filter based on input parameters
+        all_accounts = (
+            (account_name, Account.from_saved_format(data))
+            for account_name, data in read_config(
+                filename=cls._default_account_config_json_file
+            ).items()
         )
-
-        return filtered_accounts
+        return {
+            account_name: account
+            for account_name, account in all_accounts
+            if _matching_channel(account)
+            and _matching_default(account_name)
+            and _matching_name(account_name)
+        }
 
     @classmethod
     def get(
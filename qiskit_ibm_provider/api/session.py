@@ -44,6 +44,8 @@ logger = logging.getLogger(__name__)
 # the `/devices/v/1` endpoint.
 # Capture groups: (/devices/)(<device_name>)(</optional rest of the url>)
 RE_DEVICES_ENDPOINT = re.compile(r"^(.*/devices/)([^/}]{2,})(.*)$", re.IGNORECASE)
+# Number of connections kept in each per-host connection pool of a session.
+POOL_MAXSIZE = 32
 
 
 def _get_client_header() -> str:
@@ -193,7 +195,7 @@ class RetrySession(Session):
             status_forcelist=STATUS_FORCELIST,
         )
 
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        retry_adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retry)
         self.mount("http://", retry_adapter)
         self.mount("https://", retry_adapter)
 
@@ -13,7 +13,6 @@
 """A hub, group and project in an IBM Quantum account."""
 
 import logging
-from collections import OrderedDict
 from typing import Any, Dict, Optional
 
 from qiskit_ibm_provider import (  # pylint: disable=unused-import
@@ -76,12 +75,8 @@ class HubGroupProject:
         Returns:
             A dict of the remote backend instances, keyed by backend name.
         """
-        ret: OrderedDict[str, Any] = OrderedDict()
         backends = self._provider._runtime_client.list_backends(self.name)
-        if backends:
-            for backend in backends:
-                ret[backend] = None
-        return ret
+        return dict.fromkeys(backends or [])
 
     def backend(self, name: str) -> Optional["ibm_backend.IBMBackend"]:
         """Get backend by name."""
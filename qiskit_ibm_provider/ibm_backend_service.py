@@ -13,6 +13,8 @@
 """Backend namespace for an IBM Quantum account."""
 
 import logging
+import threading
+from concurrent import futures
 from datetime import datetime
 from typing import Dict, List, Callable, Optional, Any, Union
 from typing_extensions import Literal
@@ -31,7 +33,7 @@ from qiskit_ibm_provider import (
     ibm_provider,
 )
 from .api.exceptions import ApiError
-from .api.clients import AccountClient
+from .api.clients import AccountClient, RuntimeClient
 from .apiconstants import ApiJobStatus
 from .exceptions import (
     IBMBackendValueError,
@@ -56,6 +58,7 @@ from .utils.hgp import to_instance_format
 
 logger = logging.getLogger(__name__)
 PAGE_SIZE = 50
+MAX_CONFIG_WORKERS = 8
 
 
 class IBMBackendService:
@@ -95,6 +98,8 @@ class IBMBackendService:
         self._default_hgp = hgp
         self._backends: Dict[str, IBMBackend] = {}
         self._backend_configs: Dict[str, Any] = {}
+        self._config_executor: Optional[futures.ThreadPoolExecutor] = None
+        self._config_clients = threading.local()
         self._initialize_backends()
 
     def _initialize_backends(self) -> None:
@@ -106,6 +111,54 @@ class IBMBackendService:
                 if name not in self._backends:
                     self._backends[name] = None
 
+    def async_refresh_backends(self) -> futures.Future:
+        """Refresh the list of backends available to this account in the background.
+
+        The backends available to each hub/group/project are listed again in a
+        separate thread. Until the refresh finishes, the backends already known
+        are used; afterwards, :meth:`backends` returns the refreshed list. Backends
+        that are still available keep their configuration and instance, and the
+        configurations of new backends are retrieved when first needed.
+
+        Returns:
+            A future for the refresh. Calling its ``result()`` waits for the
+            refresh to finish and raises any error encountered while refreshing.
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._refresh_backends)
+        executor.shutdown(wait=False)
+        return future
+
+    def _refresh_backends(self) -> None:
+        """List the backends again and replace the cached ones.
+
+        The cached backends and configurations are each replaced by a single
+        attribute assignment rather than updated in place. This is the only
+        synchronization needed, since :meth:`backends` works on the snapshot it
+        reads and resolves missing configurations itself.
+        """
+        hgps = self._provider._get_hgps()
+        hgp_backends = [hgp._discover_remote_backends() for hgp in hgps]
+        cached_backends = self._backends
+        backends: Dict[str, Optional[IBMBackend]] = {}
+        for names in hgp_backends:
+            for name in names:
+                backends[name] = cached_backends.get(name)
+        backend_configs = {
+            name: config
+            for name, config in self._backend_configs.items()
+            if name in backends
+        }
+
+        for hgp, names in zip(hgps, hgp_backends):
+            hgp.backends = names
+        # Remove the attributes of backends that are no longer available.
+        for attr, value in list(vars(self).items()):
+            if isinstance(value, IBMBackend) and value.name not in backends:
+                delattr(self, attr)
+        self._backend_configs = backend_configs
+        self._backends = backends
+
     def _discover_backends(self) -> None:
         """Discovers the remote backends for this account, if not already known."""
         for backend in self._backends.values():
@@ -161,62 +214,98 @@ class IBMBackendService:
             QiskitBackendNotFoundError: If the backend is not found in any instance.
         """
         backends: List[IBMBackend] = []
+        # Work on the current snapshot, which a concurrent refresh may replace.
+        cached_backends = self._backends
         if name:
-            if name not in self._backends:
+            if name not in cached_backends:
                 raise QiskitBackendNotFoundError("No backend matches the criteria")
-            if not self._backends[name] or instance != self._backends[name]._instance:
-                self._set_backend_config(name)
-                self._backends[name] = self._create_backend_obj(
-                    self._backend_configs[name], instance, self._provider._get_hgps()
+            if not cached_backends[name] or instance != cached_backends[name]._instance:
+                config = self._set_backend_config(name)
+                cached_backends[name] = self._create_backend_obj(
+                    config, instance, self._provider._get_hgps()
                 )
-            if self._backends[name]:
-                backends.append(self._backends[name])
+            if cached_backends[name]:
+                backends.append(cached_backends[name])
         elif instance:
             hgp = self._provider._get_hgp(instance=instance)
+            missing = [
+                backend_name
+                for backend_name in hgp.backends.keys()
+                if not cached_backends.get(backend_name)
+                or instance != cached_backends[backend_name]._instance
+            ]
+            configs = self._set_backend_configs(missing, instance)
+            for backend_name in missing:
+                cached_backends[backend_name] = self._create_backend_obj(
+                    configs[backend_name], instance
+                )
             for backend_name in hgp.backends.keys():
-                if (
-                    not self._backends[backend_name]
-                    or instance != self._backends[backend_name]._instance
-                ):
-                    self._set_backend_config(backend_name, instance)
-                    self._backends[backend_name] = self._create_backend_obj(
-                        self._backend_configs[backend_name], instance
-                    )
-                if self._backends[backend_name]:
-                    backends.append(self._backends[backend_name])
+                if cached_backends[backend_name]:
+                    backends.append(cached_backends[backend_name])
         else:
             hgps = self._provider._get_hgps()
-            for backend_name, backend_config in self._backends.items():
-                if not backend_config:
-                    self._set_backend_config(backend_name)
-                    self._backends[backend_name] = self._create_backend_obj(
-                        self._backend_configs[backend_name], hgps=hgps
-                    )
-                if self._backends[backend_name]:
-                    backends.append(self._backends[backend_name])
+            missing = [
+                backend_name
+                for backend_name, backend in cached_backends.items()
+                if not backend
+            ]
+            configs = self._set_backend_configs(missing)
+            for backend_name in missing:
+                cached_backends[backend_name] = self._create_backend_obj(
+                    configs[backend_name], hgps=hgps
+                )
+            backends.extend(backend for backend in cached_backends.values() if backend)
         # Special handling of the `name` parameter, to support alias resolution.
         if name:
             aliases = self._aliased_backend_names()
             aliases.update(self._deprecated_backend_names())
+            if name not in aliases and not (
+                filters or kwargs or min_num_qubits or dynamic_circuits is not None
+            ):
+                # The backend was already looked up by name, nothing left to filter.
+                return backends
             name = aliases.get(name, name)
             kwargs["backend_name"] = name
-        if min_num_qubits:
-            backends = list(
-                filter(lambda b: b.configuration().n_qubits >= min_num_qubits, backends)
-            )
-        if dynamic_circuits is not None:
-            backends = list(
-                filter(
-                    lambda b: (
-                        "qasm3" in getattr(b.configuration(), "supported_features", [])
-                    )
-                    == dynamic_circuits,
-                    backends,
+        if min_num_qubits or dynamic_circuits is not None:
+            backends = [
+                backend
+                for backend in backends
+                if self._match_configuration(
+                    backend.configuration(), min_num_qubits, dynamic_circuits
                 )
-            )
+            ]
 
         return filter_backends(backends, filters=filters, **kwargs)
 
+    @staticmethod
+    def _match_configuration(
+        configuration: Union[QasmBackendConfiguration, PulseBackendConfiguration],
+        min_num_qubits: Optional[int],
+        dynamic_circuits: Optional[bool],
+    ) -> bool:
+        """Check a backend configuration against the ``backends()`` filters.
+
+        Both filters are evaluated on a single configuration lookup, so the
+        backends only need to be traversed once.
+
+        Args:
+            configuration: Backend configuration.
+            min_num_qubits: Minimum number of qubits the backend must have.
+            dynamic_circuits: Whether the backend must support dynamic circuits.
+
+        Returns:
+            Whether the configuration matches all the given filters.
+        """
+        if min_num_qubits and configuration.n_qubits < min_num_qubits:
+            return False
+        if dynamic_circuits is not None:
+            supports_dynamic_circuits = "qasm3" in getattr(
+                configuration, "supported_features", []
+            )
+            if supports_dynamic_circuits != dynamic_circuits:
+                return False
+        return True
+
     def jobs(
         self,
         limit: Optional[int] = 10,
@@ -663,21 +752,88 @@ class IBMBackendService:
 
     def _set_backend_config(
         self, backend_name: str, instance: Optional[str] = None
-    ) -> None:
+    ) -> Union[QasmBackendConfiguration, PulseBackendConfiguration]:
         """Retrieve backend configuration and add to backend_configs.
 
         Args:
             backend_name: backend name that will be returned.
             instance: the current h/g/p.
+
+        Returns:
+            The backend configuration.
         """
-        if backend_name not in self._backend_configs:
+        backend_configs = self._backend_configs
+        if backend_name not in backend_configs:
             raw_config = self._provider._runtime_client.backend_configuration(
                 backend_name
             )
             config = configuration_from_server_data(
                 raw_config=raw_config, instance=instance
             )
-            self._backend_configs[backend_name] = config
+            backend_configs[backend_name] = config
+        return backend_configs[backend_name]
+
+    def _set_backend_configs(
+        self, backend_names: List[str], instance: Optional[str] = None
+    ) -> Dict[str, Union[QasmBackendConfiguration, PulseBackendConfiguration]]:
+        """Retrieve the configurations of several backends and add to backend_configs.
+
+        The server has no endpoint returning several configurations at once, so
+        the missing ones are requested concurrently instead of one after the other.
+
+        Args:
+            backend_names: names of the backends whose configuration is needed.
+            instance: the current h/g/p.
+
+        Returns:
+            The backend configurations, keyed by backend name.
+        """
+        backend_configs = self._backend_configs
+        missing = [
+            backend_name
+            for backend_name in backend_names
+            if backend_name not in backend_configs
+        ]
+        if len(missing) == 1:
+            raw_configs = [
+                self._provider._runtime_client.backend_configuration(missing[0])
+            ]
+        elif missing:
+            if self._config_executor is None:
+                self._config_executor = futures.ThreadPoolExecutor(
+                    max_workers=MAX_CONFIG_WORKERS
+                )
+            raw_configs = list(
+                self._config_executor.map(self._retrieve_backend_configuration, missing)
+            )
+        if missing:
+            for backend_name, raw_config in zip(missing, raw_configs):
+                backend_configs[backend_name] = configuration_from_server_data(
+                    raw_config=raw_config, instance=instance
+                )
+        return {
+            backend_name: backend_configs[backend_name]
+            for backend_name in backend_names
+        }
+
+    def _retrieve_backend_configuration(self, backend_name: str) -> Dict:
+        """Retrieve the raw configuration of a backend from a worker thread.
+
+        ``requests`` sessions are not documented as thread-safe, so each worker
+        thread uses a runtime client, and therefore a session, of its own.
+
+        Args:
+            backend_name: name of the backend.
+
+        Returns:
+            The raw backend configuration.
+        """
+        client = getattr(self._config_clients, "client", None)
+        if client is None:
+            client = self._config_clients.client = RuntimeClient(
+                self._provider._client_params
+            )
+        return client.backend_configuration(backend_name)
 
     def _create_backend_obj(
         self,
@@ -183,6 +183,8 @@ class IBMProvider(Provider):
         self._runtime_client = RuntimeClient(self._client_params)
 
         self._hgps = self._initialize_hgps(self._auth_client)
+        # The first hub/group/project is the one used when no instance is given.
+        self._default_hgp = next(iter(self._hgps.values()), None)
         self._initialize_services()
 
     @staticmethod
@@ -254,11 +256,12 @@ class IBMProvider(Provider):
         # pylint: disable=unsubscriptable-object
         hgps: OrderedDict[str, HubGroupProject] = OrderedDict()
         service_urls = auth_client.current_service_urls()
+        access_token = auth_client.current_access_token()
         user_hubs = auth_client.user_hubs()
         for hub_info in user_hubs:
             # Build credentials.
             hgp_params = ClientParameters(
-                token=auth_client.current_access_token(),
+                token=access_token,
                 url=service_urls["http"],
                 instance=to_instance_format(
                     hub_info["hub"], hub_info["group"], hub_info["project"]
@@ -380,7 +383,7 @@ class IBMProvider(Provider):
             return self._hgps[instance]
 
         if not backend_name:
-            return list(self._hgps.values())[0]
+            return self._default_hgp
 
         for hgp in self._hgps.values():
             if hgp.backend(backend_name):
@@ -399,8 +402,7 @@ class IBMProvider(Provider):
         Returns:
             A list of `HubGroupProject` instancess.
         """
-        hgps = [hgp for key, hgp in self._hgps.items()]
-        return hgps
+        return list(self._hgps.values())
 
     def _initialize_services(self) -> None:
         """Initialize all services."""
@@ -429,9 +431,8 @@ class IBMProvider(Provider):
         Returns:
             A dictionary with information about the account currently in the session.
         """
-        hgps = self._get_hgps()
         active_account_dict = self._account.to_saved_format()
-        active_account_dict.update({"instance": hgps[0].name})
+        active_account_dict.update({"instance": self._default_hgp.name})
         return active_account_dict
 
     def instances(self) -> List[str]:
@@ -511,14 +512,12 @@ class IBMProvider(Provider):
             ValueError: If an invalid account is found on disk.
         """
 
-        return dict(
-            map(
-                lambda kv: (kv[0], Account.to_saved_format(kv[1])),
-                AccountManager.list(
-                    default=default, channel="ibm_quantum", name=name
-                ).items(),
-            ),
-        )
+        return {
+            account_name: account.to_saved_format()
+            for account_name, account in AccountManager.list(
+                default=default, channel="ibm_quantum", name=name
+            ).items()
+        }
 
     def backends(
         self,
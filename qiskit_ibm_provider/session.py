@@ -12,9 +12,10 @@
 
 """Qiskit Runtime flexible session."""
 
-from typing import Optional, Type, Union
+import warnings
+from typing import List, Optional, Type, Union
 from types import TracebackType
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
 from qiskit_ibm_provider.utils.converters import hms_to_seconds
 
@@ -60,6 +61,8 @@ class Session:
 
     """
 
+    __slots__ = ("_instance", "_session_id", "_active", "_max_time", "_tokens")
+
     def __init__(
         self,
         max_time: Optional[Union[int, str]] = None,
@@ -81,6 +84,7 @@ class Session:
         self._instance = None
         self._session_id = session_id
         self._active = True
+        self._tokens: List[Token] = []
 
         self._max_time = (
             max_time
@@ -111,7 +115,7 @@ class Session:
         self._active = False
 
     def __enter__(self) -> "Session":
-        set_cm_session(self)
+        self._tokens.append(_DEFAULT_SESSION.set(self))
         return self
 
     def __exit__(
@@ -120,20 +124,30 @@ class Session:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        set_cm_session(None)
+        # Restore the session that was active before entering, if any. Tokens are
+        # stacked so the same session can be entered more than once.
+        _DEFAULT_SESSION.reset(self._tokens.pop())
 
 
 # Default session
 _DEFAULT_SESSION: ContextVar[Optional[Session]] = ContextVar(
     "_DEFAULT_SESSION", default=None
 )
-_IN_SESSION_CM: ContextVar[bool] = ContextVar("_IN_SESSION_CM", default=False)
 
 
 def set_cm_session(session: Optional[Session]) -> None:
-    """Set the context manager session."""
+    """Set the context manager session.
+
+    Deprecated: use ``Session`` as a context manager instead, which restores the
+    previously active session on exit.
+    """
+    warnings.warn(
+        "set_cm_session() is deprecated and will be removed in a future release. "
+        "Use the Session class as a context manager instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     _DEFAULT_SESSION.set(session)
-    _IN_SESSION_CM.set(session is not None)
 
 
 def get_cm_session() -> Session:
@@ -19,6 +19,14 @@ from qiskit.providers import fake_provider as backend_mocks
 import qiskit_ibm_provider
 
 
+# Names of the fake backend classes that can be mocked.
+_VALID_BACKENDS = frozenset(
+    name
+    for name in dir(backend_mocks)
+    if name.startswith("Fake") and isinstance(getattr(backend_mocks, name), type)
+)
+
+
 def mock_get_backend(backend):
     """Replace qiskit_ibm_provider.IBMProvider with a mock that returns a single backend.
     Note this will set the value of qiskit_ibm_provider.IBMProvider to a MagicMock object. It is
@@ -33,12 +41,12 @@ def mock_get_backend(backend):
     Raises:
         NameError: If the specified value of backend
     """
-    mock_ibm_provider = MagicMock()
-    if not hasattr(backend_mocks, backend):
+    if backend not in _VALID_BACKENDS:
         raise NameError(
             "The specified backend name is not a valid backend from "
             "qiskit.providers.fake_provider"
         )
+    mock_ibm_provider = MagicMock()
     fake_backend = getattr(backend_mocks, backend)()
     mock_ibm_provider.get_backend.return_value = fake_backend
     mock_ibm_provider.return_value = mock_ibm_provider
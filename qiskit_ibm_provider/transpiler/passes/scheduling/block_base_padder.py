@@ -12,7 +12,7 @@
 
 """Padding pass to fill timeslots for IBM (dynamic circuit) backends."""
 
-from typing import Dict, Iterable, List, Optional, Union, Set
+from typing import Callable, Dict, Iterable, List, Optional, Union, Set, Tuple
 
 from qiskit.circuit import (
     Qubit,
@@ -64,24 +64,33 @@ class BlockBasePadder(TransformationPass):
 
     def __init__(self, schedule_idle_qubits: bool = False) -> None:
         self._node_start_time = None
+        self._padded_node_start_time: Optional[Dict[DAGNode, Tuple[int, int]]] = None
+        # Start times of the nodes in the padded dag.
         self._node_block_dags = None
         self._idle_after: Optional[Dict[Qubit, int]] = None
         self._root_dag = None
         self._dag = None
         self._block_dag = None
+        self._block_calibrations: Optional[Dict[str, Dict]] = None
+        # Calibrations of the current block dag.
         self._prev_node: Optional[DAGNode] = None
         self._wire_map: Optional[Dict[Bit, Bit]] = None
         self._block_duration = 0
         self._current_block_idx = 0
-        self._conditional_block = False
         self._bit_indices: Optional[Dict[Qubit, int]] = None
         # Nodes that the scheduling of this node is tied to.
 
         self._last_node_to_touch: Optional[Dict[Qubit, DAGNode]] = None
         # Last node to touch a bit
 
+        self._last_node_on_wire: Optional[Dict[Qubit, DAGNode]] = None
+        # Last node applied on each qubit wire of the current block dag.
+
         self._fast_path_nodes: Set[DAGNode] = set()
 
+        self._node_visitors: Dict[type, Callable[[DAGNode], None]] = {}
+        # Visitor resolved for each operation type.
+
         self._dirty_qubits: Set[Qubit] = set()
         # Qubits that are dirty in the circuit.
         self._schedule_idle_qubits = schedule_idle_qubits
@@ -118,11 +127,12 @@ class BlockBasePadder(TransformationPass):
 
     def _init_run(self, dag: DAGCircuit) -> None:
         """Setup for initial run."""
-        self._node_start_time = self.property_set["node_start_time"].copy()
+        # Take the scheduled start times and collect the padded ones in a new mapping.
+        self._node_start_time = self.property_set["node_start_time"]
+        self._padded_node_start_time = self.property_set["node_start_time"] = {}
         self._node_block_dags = self.property_set["node_block_dags"]
-        self._idle_after = {bit: 0 for bit in dag.qubits}
+        self._idle_after = {}
         self._current_block_idx = 0
-        self._conditional_block = False
         self._block_duration = 0
 
         # Prepare DAG to pad
@@ -134,7 +144,6 @@ class BlockBasePadder(TransformationPass):
         self._fast_path_nodes = set()
         self._dirty_qubits = set()
 
-        self.property_set["node_start_time"].clear()
         self._prev_node = None
         self._wire_map = {}
 
@@ -163,16 +172,15 @@ class BlockBasePadder(TransformationPass):
 
         source_wire_dag = self._root_dag if pad_wires else dag
 
-        # trivial wire map if not provided, or if the top-level dag is used
-        if not wire_map or pad_wires:
-            wire_map = {wire: wire for wire in source_wire_dag.wires}
         if dag.qregs and self._schedule_idle_qubits or not ignore_idle:
             for qreg in source_wire_dag.qregs.values():
                 new_dag.add_qreg(qreg)
         else:
+            # trivial wire map if not provided, or if the top-level dag is used
+            map_wires = bool(wire_map) and not pad_wires
             new_dag.add_qubits(
                 [
-                    wire_map[qubit]
+                    wire_map[qubit] if map_wires else qubit
                     for qubit in source_wire_dag.qubits
                     if qubit not in self._idle_qubits or not ignore_idle
                 ]
@@ -250,6 +258,10 @@ class BlockBasePadder(TransformationPass):
         """
         raise NotImplementedError
 
+    def _qubit_indices(self, node: DAGNode) -> List[int]:
+        """Get the indices of the top-level qubits a node acts on."""
+        return [self._bit_indices[qarg] for qarg in self._map_wires(node.qargs)]
+
     def _get_node_duration(self, node: DAGNode) -> int:
         """Get the duration of a node."""
         if node.op.condition_bits or isinstance(node.op, ControlFlowOp):
@@ -257,23 +269,25 @@ class BlockBasePadder(TransformationPass):
             # as zero duration to avoid padding.
             return 0
 
-        indices = [self._bit_indices[qarg] for qarg in self._map_wires(node.qargs)]
-
-        if self._block_dag.has_calibration_for(node):
+        calibrations = self._block_calibrations
+        if node.op.name in calibrations and self._block_dag.has_calibration_for(node):
             # If node has calibration, this value should be the highest priority
-            cal_key = tuple(indices), tuple(float(p) for p in node.op.params)
-            duration = self._block_dag.calibrations[node.op.name][cal_key].duration
+            cal_key = (
+                tuple(self._qubit_indices(node)),
+                tuple(float(p) for p in node.op.params),
+            )
+            duration = calibrations[node.op.name][cal_key].duration
         else:
             duration = node.op.duration
 
         if isinstance(duration, ParameterExpression):
             raise TranspilerError(
                 f"Parameterized duration ({duration}) "
-                f"of {node.op.name} on qubits {indices} is not bounded."
+                f"of {node.op.name} on qubits {self._qubit_indices(node)} is not bounded."
             )
         if duration is None:
             raise TranspilerError(
-                f"Duration of {node.op.name} on qubits {indices} is not found."
+                f"Duration of {node.op.name} on qubits {self._qubit_indices(node)} is not found."
             )
 
         return duration
@@ -283,11 +297,12 @@ class BlockBasePadder(TransformationPass):
     ) -> bool:
         # Only barrier if not in fast-path nodes
         is_fast_path_node = curr_node in self._fast_path_nodes
+        num_qubits = self._block_dag.num_qubits()
 
         def _is_terminating_barrier(node: DAGNode) -> bool:
             return (
                 isinstance(node.op, (Barrier, ControlFlowOp))
-                and len(node.qargs) == self._block_dag.num_qubits()
+                and len(node.qargs) == num_qubits
             )
 
         return not (
@@ -349,12 +364,18 @@ class BlockBasePadder(TransformationPass):
         prev_wire_map, self._wire_map = self._wire_map, wire_map
 
         prev_block_dag = self._block_dag
+        prev_block_calibrations = self._block_calibrations
+        prev_last_node_on_wire = self._last_node_on_wire
         self._block_dag = new_block_dag = self._empty_dag_like(
             block, pad_wires, wire_map=wire_map, ignore_idle=ignore_idle
         )
+        # Read once as DAGCircuit.calibrations returns a new copy on every access.
+        self._block_calibrations = new_block_dag.calibrations
+        self._last_node_on_wire = {
+            bit: new_block_dag.input_map[bit] for bit in new_block_dag.qubits
+        }
 
         self._block_duration = 0
-        self._conditional_block = False
 
         for node in block_order_op_nodes(block):
             self._visit_node(node)
@@ -373,29 +394,36 @@ class BlockBasePadder(TransformationPass):
 
         # Pop the previous block dag off the stack restoring it
         self._block_dag = prev_block_dag
+        self._block_calibrations = prev_block_calibrations
+        self._last_node_on_wire = prev_last_node_on_wire
         self._prev_node = prev_node
         self._wire_map = prev_wire_map
 
         return new_block_dag
 
     def _visit_node(self, node: DAGNode) -> None:
-        if isinstance(node.op, ControlFlowOp):
-            if isinstance(node.op, IfElseOp):
-                self._visit_if_else_op(node)
-            else:
-                self._visit_control_flow_op(node)
-        elif node in self._node_start_time:
-            if isinstance(node.op, Delay):
-                self._visit_delay(node)
-            else:
-                self._visit_generic(node)
-        else:
+        if node not in self._node_start_time:
             raise TranspilerError(
                 f"Operation {repr(node)} is likely added after the circuit is scheduled. "
                 "Schedule the circuit again if you transformed it."
             )
+        op_type = type(node.op)
+        visitor = self._node_visitors.get(op_type)
+        if visitor is None:
+            visitor = self._node_visitors[op_type] = self._resolve_node_visitor(op_type)
+        visitor(node)
         self._prev_node = node
 
+    def _resolve_node_visitor(self, op_type: type) -> Callable[[DAGNode], None]:
+        """Get the visitor method for nodes of an operation type."""
+        if issubclass(op_type, IfElseOp):
+            return self._visit_if_else_op
+        if issubclass(op_type, ControlFlowOp):
+            return self._visit_control_flow_op
+        if issubclass(op_type, Delay):
+            return self._visit_delay
+        return self._visit_generic
+
     def _visit_if_else_op(self, node: DAGNode) -> None:
         """check if is fast-path eligible otherwise fall back
         to standard ControlFlowOp handling."""
@@ -511,12 +539,11 @@ class BlockBasePadder(TransformationPass):
             self._terminate_block(self._block_duration, self._current_block_idx)
             self._add_block_terminating_barrier(block_idx, t0, node)
 
-        self._conditional_block = bool(node.op.condition_bits)
-
         self._current_block_idx = block_idx
 
         t1 = t0 + self._get_node_duration(node)  # pylint: disable=invalid-name
-        self._block_duration = max(self._block_duration, t1)
+        if t1 > self._block_duration:
+            self._block_duration = t1
 
     def _visit_generic(self, node: DAGNode) -> None:
         """Visit a generic node to pad."""
@@ -529,32 +556,27 @@ class BlockBasePadder(TransformationPass):
             self._terminate_block(self._block_duration, self._current_block_idx)
             self._add_block_terminating_barrier(block_idx, t0, node)
 
-        # This block will not be padded as it is conditional.
-        # See TODO below.
-        self._conditional_block = bool(node.op.condition_bits)
-
         # Now set the current block index.
         self._current_block_idx = block_idx
 
         t1 = t0 + self._get_node_duration(node)  # pylint: disable=invalid-name
-        self._block_duration = max(self._block_duration, t1)
+        if t1 > self._block_duration:
+            self._block_duration = t1
 
         for bit in self._map_wires(node.qargs):
             if bit in self._idle_qubits:
                 continue
             # Fill idle time with some sequence
-            if t0 - self._idle_after.get(bit, 0) > 0:
-                # Find previous node on the wire, i.e. always the latest node on the wire
-                prev_node = next(
-                    self._block_dag.predecessors(self._block_dag.output_map[bit])
-                )
+            idle_after = self._idle_after.get(bit, 0)
+            if t0 - idle_after > 0:
+                # Previous node on the wire, i.e. always the latest node on the wire
                 self._pad(
                     block_idx=block_idx,
                     qubit=bit,
-                    t_start=self._idle_after[bit],
+                    t_start=idle_after,
                     t_end=t0,
                     next_node=node,
-                    prev_node=prev_node,
+                    prev_node=self._last_node_on_wire[bit],
                 )
 
             self._idle_after[bit] = t1
@@ -583,24 +605,35 @@ class BlockBasePadder(TransformationPass):
         # the conditional circuit block.
         self._block_duration = 0
         self._pad_until_block_end(block_duration, block_idx)
-        self._idle_after = {bit: 0 for bit in self._block_dag.qubits}
+        # Qubits without an entry are idle from the start of the next block.
+        self._idle_after.clear()
 
     def _pad_until_block_end(self, block_duration: int, block_idx: int) -> None:
+        block_dag = self._block_dag
+        idle_after_times = self._idle_after
+        # Nothing to pad if the block is empty or every qubit is busy until its end.
+        if block_duration <= 0 or (
+            len(idle_after_times) == block_dag.num_qubits()
+            and min(idle_after_times.values()) >= block_duration
+        ):
+            return
+
         # Add delays until the end of circuit.
-        for bit in self._block_dag.qubits:
-            if bit in self._idle_qubits:
+        idle_qubits = self._idle_qubits
+        output_map = block_dag.output_map
+        last_node_on_wire = self._last_node_on_wire
+        for bit in block_dag.qubits:
+            if bit in idle_qubits:
                 continue
-            idle_after = self._idle_after.get(bit, 0)
+            idle_after = idle_after_times.get(bit, 0)
             if block_duration - idle_after > 0:
-                node = self._block_dag.output_map[bit]
-                prev_node = next(self._block_dag.predecessors(node))
                 self._pad(
                     block_idx=block_idx,
                     qubit=bit,
                     t_start=idle_after,
                     t_end=block_duration,
-                    next_node=node,
-                    prev_node=prev_node,
+                    next_node=output_map[bit],
+                    prev_node=last_node_on_wire[bit],
                 )
 
     def _apply_scheduled_op(
@@ -631,7 +664,9 @@ class BlockBasePadder(TransformationPass):
             clbits = [clbits]
 
         new_node = self._block_dag.apply_operation_back(oper, qubits, clbits)
-        self.property_set["node_start_time"][new_node] = (block_idx, t_start)
+        self._padded_node_start_time[new_node] = (block_idx, t_start)
+        for qubit in new_node.qargs:
+            self._last_node_on_wire[qubit] = new_node
         return new_node
 
     def _map_wires(self, wires: Iterable[Bit]) -> List[Bit]:
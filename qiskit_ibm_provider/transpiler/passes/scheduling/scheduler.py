@@ -13,7 +13,7 @@
 """Scheduler for dynamic circuit backends."""
 
 from abc import abstractmethod
-from typing import Dict, List, Optional, Union, Set, Tuple
+from typing import Callable, Dict, List, Optional, Union, Set, Tuple
 import itertools
 
 import qiskit
@@ -62,6 +62,7 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._block_dag: Optional[DAGCircuit] = None
         self._wire_map: Optional[Dict[Bit, Bit]] = None
         self._node_mapped_wires: Optional[Dict[DAGNode, List[Bit]]] = None
+        self._node_mapped_qubits: Optional[Dict[DAGNode, List[Qubit]]] = None
         self._node_block_dags: Dict[DAGNode, DAGCircuit] = {}
         # Mapping of control-flow nodes to their containing blocks
         self._block_idx_dag_map: Dict[int, DAGCircuit] = {}
@@ -77,10 +78,23 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         # Dictionary of blocks each containing a dictionary with the key for each bit
         # in the block and its value being the final time of the bit within the block.
         self._current_block_measures: Set[DAGNode] = set()
+        self._current_block_measure_qubits: Set[Qubit] = set()
+        # Qubits of the measurements in the current block.
         self._current_block_measures_has_reset: bool = False
         self._node_tied_to: Optional[Dict[DAGNode, Set[DAGNode]]] = None
         # Nodes that the scheduling of this node is tied to.
         self._bit_indices: Optional[Dict[Qubit, int]] = None
+        self._node_durations: Optional[Dict[DAGNode, int]] = None
+        # Durations already resolved for each node.
+        self._dag_calibrations: Optional[Dict[int, Dict[str, Dict]]] = None
+        # Calibrations of each block dag keyed by the id of the dag.
+        self._block_bit_indices: Optional[Dict[Qubit, int]] = None
+        # Indices of the qubits within the current block dag.
+        self._measure_durations: Optional[Dict[Tuple[int, ...], int]] = None
+        # Measurement durations keyed by the measured qubit indices.
+
+        self._node_visitors: Dict[type, Tuple[Callable[[DAGNode], None], bool]] = {}
+        # Visitor resolved for each operation type.
 
         self._time_unit_converter = TimeUnitConversion(durations)
 
@@ -95,6 +109,8 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         prev_block_dag = self._block_dag
         self._block_dag = block
         prev_wire_map, self._wire_map = self._wire_map, wire_map
+        prev_block_bit_indices = self._block_bit_indices
+        self._block_bit_indices = {bit: index for index, bit in enumerate(block.qubits)}
 
         # We must run this on the individual block
         # as the current implementation does not recurse
@@ -111,23 +127,34 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         # Pop the previous block dag off the stack restoring it
         self._block_dag = prev_block_dag
         self._wire_map = prev_wire_map
+        self._block_bit_indices = prev_block_bit_indices
 
     def _visit_node(self, node: DAGNode) -> None:
-        if isinstance(node.op, ControlFlowOp):
-            self._visit_control_flow_op(node)
-        elif node.op.condition_bits:
+        op_type = type(node.op)
+        entry = self._node_visitors.get(op_type)
+        if entry is None:
+            entry = self._node_visitors[op_type] = self._resolve_node_visitor(op_type)
+        visitor, is_control_flow = entry
+        if not is_control_flow and node.op.condition_bits:
             raise TranspilerError(
                 "c_if control-flow is not supported by this pass. "
                 'Please apply "ConvertConditionsToIfOps" to convert these '
                 "conditional operations to new-style Qiskit control-flow."
             )
-        else:
-            if isinstance(node.op, Measure):
-                self._visit_measure(node)
-            elif isinstance(node.op, Reset):
-                self._visit_reset(node)
-            else:
-                self._visit_generic(node)
+        visitor(node)
+
+    def _resolve_node_visitor(
+        self, op_type: type
+    ) -> Tuple[Callable[[DAGNode], None], bool]:
+        """Get the visitor method for nodes of an operation type and whether
+        the operation is a control-flow operation."""
+        if issubclass(op_type, ControlFlowOp):
+            return self._visit_control_flow_op, True
+        if issubclass(op_type, Measure):
+            return self._visit_measure, False
+        if issubclass(op_type, Reset):
+            return self._visit_reset, False
+        return self._visit_generic, False
 
     def _visit_control_flow_op(self, node: DAGNode) -> None:
         # TODO: This is a hack required to tie nodes of control-flow
@@ -164,13 +191,73 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         # Begin new block for exit to "then" block.
         self._begin_new_circuit_block()
 
-    @abstractmethod
     def _visit_measure(self, node: DAGNode) -> None:
-        raise NotImplementedError
+        """Visit a measurement node.
+
+        Measurement currently triggers the end of a deterministically scheduled block
+        of instructions in IBM dynamic circuits hardware.
+        This means that it is possible to schedule *up to* a measurement (and during its pulses)
+        but the measurement will be followed by a period of indeterminism.
+        All measurements on disjoint qubits that topologically follow another
+        measurement will be collected and performed in parallel. A measurement on a qubit
+        intersecting with the set of qubits to be measured in parallel will trigger the
+        end of a scheduling block with said measurement occurring in a following block
+        which begins another grouping sequence. This behavior will change in future
+        backend software updates."""
+
+        current_block_measure_qargs = self._current_block_measure_qargs()
+        # We handle several qubits here as _visit_reset currently calls
+        # this method and a reset may have multiple qubits.
+        measure_qargs = self._map_qubits(node)
+
+        t0q = max(
+            self._current_block_bit_times[q] for q in measure_qargs
+        )  # pylint: disable=invalid-name
+
+        # If the measurement qubits overlap, we need to flush measurements and start a
+        # new scheduling block.
+        if not current_block_measure_qargs.isdisjoint(measure_qargs):
+            if self._current_block_measures_has_reset:
+                # If a reset is included we must trigger the end of a block.
+                self._begin_new_circuit_block()
+                t0q = 0
+            else:
+                # Otherwise just trigger a measurement flush
+                self._flush_measures()
+        else:
+            # Otherwise we need to increment all measurements to start at the same time within the block.
+            t0q = max(  # pylint: disable=invalid-name
+                itertools.chain(
+                    [t0q],
+                    (
+                        self._node_start_time[measure][1]
+                        for measure in self._current_block_measures
+                    ),
+                )
+            )
+
+        # Insert this measure into the block
+        self._current_block_measures.add(node)
+        self._current_block_measure_qubits.update(measure_qargs)
+
+        for measure in self._current_block_measures:
+            measure_duration = self._get_measure_duration(measure)
+            self._update_bit_times(measure, t0q, t0q + measure_duration)
 
-    @abstractmethod
     def _visit_reset(self, node: DAGNode) -> None:
-        raise NotImplementedError
+        """Visit a reset node.
+
+        Reset currently triggers the end of a pulse block in IBM dynamic circuits hardware
+        as conditional reset is performed internally using a c_if. This means that it is
+        possible to schedule *up to* a reset (and during its measurement pulses)
+        but the reset will be followed by a period of conditional indeterminism.
+        All resets on disjoint qubits will be collected on the same qubits to be run simultaneously.
+        """
+        # Process as measurement
+        self._current_block_measures_has_reset = True
+        self._visit_measure(node)
+        # Then set that we are now a conditional node.
+        self._control_flow_block = True
 
     @abstractmethod
     def _visit_generic(self, node: DAGNode) -> None:
@@ -183,6 +270,7 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._block_dag = None
         self._wire_map = {wire: wire for wire in dag.wires}
         self._node_mapped_wires = {}
+        self._node_mapped_qubits = {}
         self._node_block_dags = {}
         self._block_idx_dag_map = {}
 
@@ -197,25 +285,43 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         self._node_stop_time = {}
         self._bit_stop_times = {0: {q: 0 for q in dag.qubits + dag.clbits}}
         self._current_block_measures = set()
+        self._current_block_measure_qubits = set()
         self._current_block_measures_has_reset = False
         self._node_tied_to = {}
         self._bit_indices = {q: index for index, q in enumerate(dag.qubits)}
+        self._node_durations = {}
+        self._dag_calibrations = {}
+        self._measure_durations = {}
+
+    def _qubit_indices(self, node: DAGNode) -> List[int]:
+        """Get the indices of the top-level qubits a node acts on."""
+        return [self._bit_indices[qarg] for qarg in self._map_qubits(node)]
 
     def _get_duration(self, node: DAGNode, dag: Optional[DAGCircuit] = None) -> int:
+        # Durations are requested again when pushing ALAP block times so
+        # only resolve them once per node.
+        duration = self._node_durations.get(node)
+        if duration is None:
+            duration = self._node_durations[node] = self._compute_duration(node, dag)
+        return duration
+
+    def _compute_duration(self, node: DAGNode, dag: Optional[DAGCircuit] = None) -> int:
         if node.op.condition_bits or isinstance(node.op, ControlFlowOp):
             # As we cannot currently schedule through conditionals model
             # as zero duration to avoid padding.
             return 0
 
-        indices = [self._bit_indices[qarg] for qarg in self._map_qubits(node)]
-
         # Fall back to current block dag if not specified.
         dag = dag or self._block_dag
 
-        if dag.has_calibration_for(node):
+        calibrations = self._get_calibrations(dag)
+        if node.op.name in calibrations and dag.has_calibration_for(node):
             # If node has calibration, this value should be the highest priority
-            cal_key = tuple(indices), tuple(float(p) for p in node.op.params)
-            duration = dag.calibrations[node.op.name][cal_key].duration
+            cal_key = (
+                tuple(self._qubit_indices(node)),
+                tuple(float(p) for p in node.op.params),
+            )
+            duration = calibrations[node.op.name][cal_key].duration
             node.op.duration = duration
         else:
             duration = node.op.duration
@@ -223,21 +329,48 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         if isinstance(duration, ParameterExpression):
             raise TranspilerError(
                 f"Parameterized duration ({duration}) "
-                f"of {node.op.name} on qubits {indices} is not bounded."
+                f"of {node.op.name} on qubits {self._qubit_indices(node)} is not bounded."
             )
         if duration is None:
             raise TranspilerError(
-                f"Duration of {node.op.name} on qubits {indices} is not found."
+                f"Duration of {node.op.name} on qubits {self._qubit_indices(node)} is not found."
             )
 
         return duration
 
+    def _get_calibrations(self, dag: DAGCircuit) -> Dict[str, Dict]:
+        """Get the calibrations of a block dag.
+
+        ``DAGCircuit.calibrations`` returns a new copy on every access so
+        it is only read once per block dag.
+        """
+        calibrations = self._dag_calibrations.get(id(dag))
+        if calibrations is None:
+            calibrations = self._dag_calibrations[id(dag)] = dag.calibrations
+        return calibrations
+
+    def _get_measure_duration(self, node: DAGNode) -> int:
+        """Get the duration of a measurement or reset.
+
+        Measurements on the same qubits share a duration, so it is looked up in
+        the instruction durations only once per run.
+        """
+        indices = tuple(
+            self._block_bit_indices[qarg] for qarg in self._map_qubits(node)
+        )
+        duration = self._measure_durations.get(indices)
+        if duration is None:
+            duration = self._measure_durations[indices] = self._durations.get(
+                "measure", list(indices), unit="dt"
+            )
+        return duration
+
     def _update_bit_times(  # pylint: disable=invalid-name
         self, node: DAGNode, t0: int, t1: int, update_cargs: bool = True
     ) -> None:
-        self._max_block_t1[self._current_block_idx] = max(
-            self._max_block_t1.get(self._current_block_idx, 0), t1
-        )
+        # Times are never negative so the first node of a block always sets its entry.
+        if t1 > self._max_block_t1.get(self._current_block_idx, -1):
+            self._max_block_t1[self._current_block_idx] = t1
 
         update_bits = self._map_wires(node) if update_cargs else self._map_qubits(node)
         for bit in update_bits:
@@ -262,17 +395,15 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
             self._node_tied_to[node] = self._current_block_measures.copy()
 
         self._current_block_measures = set()
+        self._current_block_measure_qubits = set()
         self._current_block_measures_has_reset = False
 
     def _current_block_measure_qargs(self) -> Set[Qubit]:
-        return set(
-            qarg
-            for measure in self._current_block_measures
-            for qarg in self._map_qubits(measure)
-        )
+        return self._current_block_measure_qubits
 
     def _check_flush_measures(self, node: DAGNode) -> None:
-        if self._current_block_measure_qargs() & set(self._map_qubits(node)):
+        measure_qubits = self._current_block_measure_qubits
+        if measure_qubits and not measure_qubits.isdisjoint(self._map_qubits(node)):
             if self._current_block_measures_has_reset:
                 # If a reset is included we must trigger the end of a block.
                 self._begin_new_circuit_block()
@@ -286,8 +417,10 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
         TODO: We should have an easier approach to wire mapping from the transpiler.
         """
         if node not in self._node_mapped_wires:
+            # Most nodes are gates without classical bits.
+            wires = node.qargs + node.cargs if node.cargs else node.qargs
             self._node_mapped_wires[node] = wire_map = [
-                self._wire_map[q] for q in node.qargs + node.cargs
+                self._wire_map[q] for q in wires
             ]
             return wire_map
 
@@ -298,7 +431,13 @@ class BaseDynamicCircuitAnalysis(TransformationPass):
 
         TODO: We should have an easier approach to wire mapping from the transpiler.
         """
-        return [wire for wire in self._map_wires(node) if isinstance(wire, Qubit)]
+        if node not in self._node_mapped_qubits:
+            self._node_mapped_qubits[node] = qubits = [
+                wire for wire in self._map_wires(node) if isinstance(wire, Qubit)
+            ]
+            return qubits
+
+        return self._node_mapped_qubits[node]
 
 
 class ASAPScheduleAnalysis(BaseDynamicCircuitAnalysis):
@@ -343,82 +482,6 @@ class ASAPScheduleAnalysis(BaseDynamicCircuitAnalysis):
         self.property_set["node_block_dags"] = self._node_block_dags
         return dag
 
-    def _visit_measure(self, node: DAGNode) -> None:
-        """Visit a measurement node.
-
-        Measurement currently triggers the end of a deterministically scheduled block
-        of instructions in IBM dynamic circuits hardware.
-        This means that it is possible to schedule *up to* a measurement (and during its pulses)
-        but the measurement will be followed by a period of indeterminism.
-        All measurements on disjoint qubits that topologically follow another
-        measurement will be collected and performed in parallel. A measurement on a qubit
-        intersecting with the set of qubits to be measured in parallel will trigger the
-        end of a scheduling block with said measurement occurring in a following block
-        which begins another grouping sequence. This behavior will change in future
-        backend software updates."""
-
-        current_block_measure_qargs = self._current_block_measure_qargs()
-        # We handle a set of qubits here as _visit_reset currently calls
-        # this method and a reset may have multiple qubits.
-        measure_qargs = set(self._map_qubits(node))
-
-        t0q = max(
-            self._current_block_bit_times[q] for q in measure_qargs
-        )  # pylint: disable=invalid-name
-
-        # If the measurement qubits overlap, we need to flush measurements and start a
-        # new scheduling block.
-        if current_block_measure_qargs & measure_qargs:
-            if self._current_block_measures_has_reset:
-                # If a reset is included we must trigger the end of a block.
-                self._begin_new_circuit_block()
-                t0q = 0
-            else:
-                # Otherwise just trigger a measurement flush
-                self._flush_measures()
-        else:
-            # Otherwise we need to increment all measurements to start at the same time within the block.
-            t0q = max(  # pylint: disable=invalid-name
-                itertools.chain(
-                    [t0q],
-                    (
-                        self._node_start_time[measure][1]
-                        for measure in self._current_block_measures
-                    ),
-                )
-            )
-
-        # Insert this measure into the block
-        self._current_block_measures.add(node)
-
-        for measure in self._current_block_measures:
-            t0 = t0q  # pylint: disable=invalid-name
-            bit_indices = {
-                bit: index for index, bit in enumerate(self._block_dag.qubits)
-            }
-            measure_duration = self._durations.get(
-                Measure(),
-                [bit_indices[qarg] for qarg in self._map_qubits(measure)],
-                unit="dt",
-            )
-            t1 = t0 + measure_duration  # pylint: disable=invalid-name
-            self._update_bit_times(measure, t0, t1)
-
-    def _visit_reset(self, node: DAGNode) -> None:
-        """Visit a reset node.
-
-        Reset currently triggers the end of a pulse block in IBM dynamic circuits hardware
-        as conditional reset is performed internally using a c_if. This means that it is
-        possible to schedule *up to* a reset (and during its measurement pulses)
-        but the reset will be followed by a period of conditional indeterminism.
-        All resets on disjoint qubits will be collected on the same qubits to be run simultaneously.
-        """
-        # Process as measurement
-        self._current_block_measures_has_reset = True
-        self._visit_measure(node)
-        # Then set that we are now a conditional node.
-        self._control_flow_block = True
-
     def _visit_generic(self, node: DAGNode) -> None:
         """Visit a generic node such as a gate or barrier."""
         op_duration = self._get_duration(node)
@@ -476,82 +539,6 @@ class ALAPScheduleAnalysis(BaseDynamicCircuitAnalysis):
         self.property_set["node_block_dags"] = self._node_block_dags
         return dag
 
-    def _visit_measure(self, node: DAGNode) -> None:
-        """Visit a measurement node.
-
-        Measurement currently triggers the end of a deterministically scheduled block
-        of instructions in IBM dynamic circuits hardware.
-        This means that it is possible to schedule *up to* a measurement (and during its pulses)
-        but the measurement will be followed by a period of indeterminism.
-        All measurements on disjoint qubits that topologically follow another
-        measurement will be collected and performed in parallel. A measurement on a qubit
-        intersecting with the set of qubits to be measured in parallel will trigger the
-        end of a scheduling block with said measurement occurring in a following block
-        which begins another grouping sequence. This behavior will change in future
-        backend software updates."""
-
-        current_block_measure_qargs = self._current_block_measure_qargs()
-        # We handle a set of qubits here as _visit_reset currently calls
-        # this method and a reset may have multiple qubits.
-        measure_qargs = set(self._map_qubits(node))
-
-        t0q = max(
-            self._current_block_bit_times[q] for q in measure_qargs
-        )  # pylint: disable=invalid-name
-
-        # If the measurement qubits overlap, we need to flush measurements and start a
-        # new scheduling block.
-        if current_block_measure_qargs & measure_qargs:
-            if self._current_block_measures_has_reset:
-                # If a reset is included we must trigger the end of a block.
-                self._begin_new_circuit_block()
-                t0q = 0
-            else:
-                # Otherwise just trigger a measurement flush
-                self._flush_measures()
-        else:
-            # Otherwise we need to increment all measurements to start at the same time within the block.
-            t0q = max(  # pylint: disable=invalid-name
-                itertools.chain(
-                    [t0q],
-                    (
-                        self._node_start_time[measure][1]
-                        for measure in self._current_block_measures
-                    ),
-                )
-            )
-
-        # Insert this measure into the block
-        self._current_block_measures.add(node)
-
-        for measure in self._current_block_measures:
-            t0 = t0q  # pylint: disable=invalid-name
-            bit_indices = {
-                bit: index for index, bit in enumerate(self._block_dag.qubits)
-            }
-            measure_duration = self._durations.get(
-                Measure(),
-                [bit_indices[qarg] for qarg in self._map_qubits(measure)],
-                unit="dt",
-            )
-            t1 = t0 + measure_duration  # pylint: disable=invalid-name
-            self._update_bit_times(measure, t0, t1)
-
-    def _visit_reset(self, node: DAGNode) -> None:
-        """Visit a reset node.
-
-        Reset currently triggers the end of a pulse block in IBM dynamic circuits hardware
-        as conditional reset is performed internally using a c_if. This means that it is
-        possible to schedule *up to* a reset (and during its measurement pulses)
-        but the reset will be followed by a period of conditional indeterminism.
-        All resets on disjoint qubits will be collected on the same qubits to be run simultaneously.
-        """
-        # Process as measurement
-        self._current_block_measures_has_reset = True
-        self._visit_measure(node)
-        # Then set that we are now a conditional node.
-        self._control_flow_block = True
-
     def _visit_generic(self, node: DAGNode) -> None:
         """Visit a generic node such as a gate or barrier."""
 
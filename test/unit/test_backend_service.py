@@ -0,0 +1,138 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend service."""
+
+import copy
+from unittest import mock
+
+try:
+    from qiskit.providers.fake_provider import Fake5QV1
+except ImportError:
+    from qiskit.providers.fake_provider import FakeManila as Fake5QV1
+
+from qiskit_ibm_provider.api.exceptions import RequestsApiError
+from qiskit_ibm_provider.ibm_backend_service import IBMBackendService
+
+from ..ibm_test_case import IBMTestCase
+
+
+class TestBackendService(IBMTestCase):
+    """Tests for IBMBackendService class."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.configs = {}
+        for backend_name in ["backend_a", "backend_b"]:
+            config = copy.deepcopy(Fake5QV1().configuration())
+            config.backend_name = backend_name
+            self.configs[backend_name] = config
+
+        self.hgp = mock.MagicMock()
+        self.hgp._hub, self.hgp._group, self.hgp._project = "hub", "group", "project"
+        self.hgp.backends = dict.fromkeys(self.configs)
+        self.hgp._discover_remote_backends.side_effect = lambda: dict.fromkeys(
+            self.configs
+        )
+
+        self.provider = mock.MagicMock()
+        self.provider._get_hgps.return_value = [self.hgp]
+        self.provider._get_hgp.return_value = self.hgp
+        self.provider._runtime_client.backend_configuration.side_effect = (
+            lambda backend_name: self.configs[backend_name]
+        )
+
+        decoder = mock.patch(
+            "qiskit_ibm_provider.ibm_backend_service.configuration_from_server_data",
+            side_effect=lambda raw_config, instance=None: raw_config,
+        )
+        decoder.start()
+        self.addCleanup(decoder.stop)
+        client = mock.patch(
+            "qiskit_ibm_provider.ibm_backend_service.RuntimeClient",
+            return_value=self.provider._runtime_client,
+        )
+        client.start()
+        self.addCleanup(client.stop)
+        self.service = IBMBackendService(self.provider, self.hgp)
+
+    def test_backends(self):
+        """Test retrieving and filtering the backends."""
+        names = [backend.name for backend in self.service.backends()]
+        self.assertEqual(names, ["backend_a", "backend_b"])
+        self.assertEqual(
+            [backend.name for backend in self.service.backends(name="backend_b")],
+            ["backend_b"],
+        )
+        self.assertFalse(self.service.backends(min_num_qubits=6))
+        self.assertFalse(self.service.backends(name="backend_b", n_qubits=6))
+        self.assertEqual(
+            self.provider._runtime_client.backend_configuration.call_count, 2
+        )
+
+    def test_async_refresh_backends(self):
+        """Test refreshing the backends in the background."""
+        old_backend = self.service.backends(name="backend_a")[0]
+        self.service.backend_b = self.service.backends(name="backend_b")[0]
+        self.configs["backend_c"] = self.configs.pop("backend_b")
+        self.configs["backend_c"].backend_name = "backend_c"
+        backend_configuration = self.provider._runtime_client.backend_configuration
+        config_calls = backend_configuration.call_count
+
+        self.service.async_refresh_backends().result()
+
+        self.assertEqual(self.hgp.backends, dict.fromkeys(["backend_a", "backend_c"]))
+        self.assertFalse(hasattr(self.service, "backend_b"))
+        self.assertEqual(backend_configuration.call_count, config_calls)
+        backends = self.service.backends()
+        self.assertEqual(
+            [backend.name for backend in backends], ["backend_a", "backend_c"]
+        )
+        self.assertIs(backends[0], old_backend)
+        # Only the configuration of the new backend is retrieved.
+        self.assertEqual(backend_configuration.call_count, config_calls + 1)
+
+    def test_async_refresh_backends_error(self):
+        """Test errors while refreshing are raised by the returned future."""
+        self.hgp._discover_remote_backends.side_effect = ValueError("unavailable")
+        with self.assertRaises(ValueError):
+            self.service.async_refresh_backends().result()
+        self.assertEqual(
+            [backend.name for backend in self.service.backends()],
+            ["backend_a", "backend_b"],
+        )
+
+    def test_backends_config_error(self):
+        """Test a failing configuration retrieval does not store partial results."""
+        backend_configuration = self.provider._runtime_client.backend_configuration
+        backend_configuration.side_effect = lambda backend_name: (
+            self.configs[backend_name]
+            if backend_name == "backend_a"
+            else self._raise_api_error()
+        )
+        with self.assertRaises(RequestsApiError):
+            self.service.backends()
+        self.assertFalse(self.service._backend_configs)
+
+        backend_configuration.side_effect = lambda backend_name: self.configs[
+            backend_name
+        ]
+        self.assertEqual(
+            [backend.name for backend in self.service.backends()],
+            ["backend_a", "backend_b"],
+        )
+
+    @staticmethod
+    def _raise_api_error():
+        """Raise the error returned for an unavailable configuration."""
+        raise RequestsApiError("unavailable", status_code=503)
@@ -0,0 +1,38 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the RetrySession class."""
+
+from qiskit_ibm_provider.api.session import POOL_MAXSIZE, RetrySession
+
+from ..ibm_test_case import IBMTestCase
+
+
+class TestRetrySession(IBMTestCase):
+    """Tests for RetrySession."""
+
+    def test_sessions_use_own_connection_pool(self):
+        """Test each session mounts its own adapter with a larger connection pool."""
+        session_a = RetrySession("https://auth.example.com/api")
+        session_b = RetrySession("https://runtime.example.com", verify=False)
+        adapter = session_a.get_adapter("https://auth.example.com/api")
+        self.assertIs(adapter, session_a.get_adapter("http://auth.example.com/api"))
+        self.assertIsNot(adapter, session_b.get_adapter("https://runtime.example.com"))
+        self.assertEqual(adapter._pool_maxsize, POOL_MAXSIZE)
+
+    def test_close_releases_pool(self):
+        """Test closing a session clears its connection pools."""
+        session = RetrySession("https://runtime.example.com")
+        adapter = session.get_adapter("https://runtime.example.com")
+        adapter.poolmanager.connection_from_url("https://runtime.example.com")
+        session.close()
+        self.assertEqual(len(adapter.poolmanager.pools), 0)
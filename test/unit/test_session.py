@@ -19,6 +19,7 @@ try:
 except ImportError:
     from qiskit.providers.fake_provider import FakeManila as Fake5QV1
 from qiskit_ibm_provider import IBMBackend
+from qiskit_ibm_provider.session import Session, get_cm_session, set_cm_session
 
 from ..ibm_test_case import IBMTestCase
 
@@ -57,3 +58,26 @@ class TestSession(IBMTestCase):
             with self.subTest(max_time=max_t):
                 backend.open_session(max_time=max_t)
                 self.assertEqual(backend.session._max_time, expected)
+
+    def test_context_manager(self):
+        """Test the session is set as the context managed session."""
+        self.assertIsNone(get_cm_session())
+        with Session() as outer:
+            self.assertIs(get_cm_session(), outer)
+            with Session() as inner:
+                self.assertIs(get_cm_session(), inner)
+            self.assertIs(get_cm_session(), outer)
+            with outer:
+                self.assertIs(get_cm_session(), outer)
+            self.assertIs(get_cm_session(), outer)
+        self.assertIsNone(get_cm_session())
+
+    def test_set_cm_session_deprecated(self):
+        """Test set_cm_session still sets the session with a deprecation warning."""
+        session = Session()
+        with self.assertWarns(DeprecationWarning):
+            set_cm_session(session)
+        self.assertIs(get_cm_session(), session)
+        with self.assertWarns(DeprecationWarning):
+            set_cm_session(None)
+        self.assertIsNone(get_cm_session())
@@ -910,6 +910,27 @@ class TestALAPSchedulingAndPaddingPass(IBMTestCase):
 
         self.assertEqual(expected, scheduled)
 
+    def test_alap_durations_resolved_once(self):
+        """Test ALAP scheduling resolves the duration of each node only once."""
+        durations = DynamicCircuitInstructionDurations(
+            [("x", None, 200), ("measure", None, 840)]
+        )
+        qc = QuantumCircuit(2, 1)
+        qc.x(0)
+        qc.measure(0, 0)
+        qc.x(1)
+        qc.x(1)
+
+        with patch.object(
+            ALAPScheduleAnalysis,
+            "_compute_duration",
+            autospec=True,
+            side_effect=ALAPScheduleAnalysis._compute_duration,
+        ) as compute_duration:
+            PassManager([ALAPScheduleAnalysis(durations)]).run(qc)
+
+        self.assertEqual(compute_duration.call_count, 4)
+
     def test_if_test_gate_after_measure(self):
         """Test if schedules circuits with c_if after measure with a common clbit.
         See: https://github.com/Qiskit/qiskit-terra/issues/7654"""